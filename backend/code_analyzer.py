@@ -1,18 +1,31 @@
-from typing import Dict, Any, List, Tuple
+from typing import Dict, Any, List, Tuple, Optional
 import re
 
 class CodeAnalyzer:
     """Handles detailed code analysis and scoring logic."""
     
-    def __init__(self):
-        self.category_weights = {
-            "naming_conventions": 10,
-            "function_modularity": 20,
-            "documentation": 20,
-            "formatting": 15,
-            "reusability": 15,
-            "best_practices": 20
-        }
+    DEFAULT_CATEGORY_WEIGHTS = {
+        "naming_conventions": 10,
+        "function_modularity": 20,
+        "documentation": 20,
+        "formatting": 15,
+        "reusability": 15,
+        "best_practices": 20
+    }
+    
+    DEFAULT_BASE_DEDUCTIONS = {
+        "naming_conventions": 2,
+        "function_modularity": 4,
+        "documentation": 3,
+        "formatting": 2,
+        "reusability": 3,
+        "best_practices": 3
+    }
+    
+    def __init__(self, category_weights: Optional[Dict[str, float]] = None,
+                 base_deductions: Optional[Dict[str, float]] = None):
+        self.category_weights = {**self.DEFAULT_CATEGORY_WEIGHTS, **(category_weights or {})}
+        self.base_deductions = {**self.DEFAULT_BASE_DEDUCTIONS, **(base_deductions or {})}
         
     def analyze_violations(self, violations: List[Dict[str, Any]], file_type: str) -> Dict[str, Any]:
         """
@@ -97,16 +110,7 @@ class CodeAnalyzer:
     
     def _calculate_deduction(self, category: str, severity_weight: float) -> float:
         """Calculate the score deduction for a violation."""
-        base_deductions = {
-            "naming_conventions": 2,
-            "function_modularity": 4,
-            "documentation": 3,
-            "formatting": 2,
-            "reusability": 3,
-            "best_practices": 3
-        }
-        
-        return base_deductions.get(category, 2) * severity_weight
+        return self.base_deductions.get(category, 2) * severity_weight
     
     def _generate_detailed_analysis(self, categorized_violations: Dict[str, List[Dict]]) -> Dict[str, Any]:
         """Generate detailed analysis for each category."""
@@ -0,0 +1,256 @@
+import os
+import re
+import json
+import shutil
+import hashlib
+import tempfile
+import threading
+from collections import OrderedDict
+from typing import Dict, Any, List, Optional
+from code_analyzer import CodeAnalyzer
+
+# Pylint options a client may override. Options such as load-plugins or
+# init-hook would let a request run arbitrary code, so they are not listed.
+PYLINT_INT_OPTIONS = {
+    "max-line-length",
+    "max-module-lines",
+    "max-args",
+    "max-locals",
+    "max-returns",
+    "max-branches",
+    "max-statements",
+    "max-attributes",
+    "max-bool-expr",
+    "max-nested-blocks",
+    "max-parents",
+    "min-public-methods",
+    "max-public-methods",
+    "min-similarity-lines",
+}
+PYLINT_NAME_LIST_OPTIONS = {"good-names", "bad-names"}
+
+# ESLint plugins installed in config/package.json
+ESLINT_PLUGINS = {"react", "react-hooks", "jsx-a11y"}
+ESLINT_SEVERITIES = {0, 1, 2, "off", "warn", "error"}
+
+PYLINT_MESSAGE_PATTERN = re.compile(r'^[A-Za-z0-9-]+$')
+PYTHON_NAME_PATTERN = re.compile(r'^[A-Za-z_][A-Za-z0-9_]*$')
+ESLINT_RULE_PATTERN = re.compile(r'^(?:([a-z0-9-]+)/)?[a-z0-9-]+$')
+PROFILE_KEYS = {"pylint", "eslint", "category_weights", "base_deductions"}
+
+
+class LintConfigError(ValueError):
+    """Raised when a lint profile or override is invalid."""
+
+
+class CompiledLintConfig:
+    """A lint profile resolved into linter arguments and a scoring table."""
+
+    def __init__(self, key: str, pylint_args: List[str], eslint_config_path: Optional[str],
+                 code_analyzer: CodeAnalyzer):
+        self.key = key
+        self.pylint_args = pylint_args
+        self.eslint_config_path = eslint_config_path
+        self.code_analyzer = code_analyzer
+
+
+def _merge_profiles(base: Dict[str, Any], override: Dict[str, Any]) -> Dict[str, Any]:
+    """Merge an inline override on top of a named profile, one level deep per section."""
+    merged = {}
+    for key in PROFILE_KEYS:
+        base_section = base.get(key, {})
+        override_section = override.get(key, {})
+        if key == "pylint":
+            merged[key] = {
+                "enable": base_section.get("enable", []) + override_section.get("enable", []),
+                "disable": base_section.get("disable", []) + override_section.get("disable", []),
+                "options": {**base_section.get("options", {}), **override_section.get("options", {})}
+            }
+        elif key == "eslint":
+            merged[key] = {"rules": {**base_section.get("rules", {}), **override_section.get("rules", {})}}
+        else:
+            merged[key] = {**base_section, **override_section}
+    return merged
+
+
+def _validate_profile(profile: Any, name: str) -> None:
+    """Check the shape of a profile or inline override."""
+    if not isinstance(profile, dict):
+        raise LintConfigError(f"{name} must be a JSON object")
+
+    unknown = set(profile) - PROFILE_KEYS
+    if unknown:
+        raise LintConfigError(f"Unknown keys in {name}: {', '.join(sorted(unknown))}")
+
+    pylint = profile.get("pylint", {})
+    if not isinstance(pylint, dict):
+        raise LintConfigError(f"{name}.pylint must be a JSON object")
+    for field in ("enable", "disable"):
+        messages = pylint.get(field, [])
+        if not isinstance(messages, list) or not all(
+            isinstance(m, str) and PYLINT_MESSAGE_PATTERN.match(m) for m in messages
+        ):
+            raise LintConfigError(f"{name}.pylint.{field} must be a list of message ids or names")
+    options = pylint.get("options", {})
+    if not isinstance(options, dict):
+        raise LintConfigError(f"{name}.pylint.options must be a JSON object")
+    for option, value in options.items():
+        if option in PYLINT_INT_OPTIONS:
+            if not isinstance(value, int) or isinstance(value, bool) or value < 0:
+                raise LintConfigError(f"Pylint option {option} must be a non-negative integer")
+        elif option in PYLINT_NAME_LIST_OPTIONS:
+            names = value.split(',') if isinstance(value, str) else value
+            if not isinstance(names, list) or not all(
+                isinstance(n, str) and PYTHON_NAME_PATTERN.match(n.strip()) for n in names
+            ):
+                raise LintConfigError(f"Pylint option {option} must be a list of names")
+        else:
+            raise LintConfigError(f"Pylint option not allowed: {option}")
+
+    eslint = profile.get("eslint", {})
+    rules = eslint.get("rules", {}) if isinstance(eslint, dict) else None
+    if not isinstance(rules, dict):
+        raise LintConfigError(f"{name}.eslint.rules must be a JSON object")
+    for rule, setting in rules.items():
+        match = ESLINT_RULE_PATTERN.match(rule)
+        if not match:
+            raise LintConfigError(f"Invalid ESLint rule name: {rule}")
+        if match.group(1) and match.group(1) not in ESLINT_PLUGINS:
+            raise LintConfigError(f"ESLint plugin not available for rule {rule}")
+        severity = setting[0] if isinstance(setting, list) and setting else setting
+        if not isinstance(severity, (int, str)) or isinstance(severity, bool) or severity not in ESLINT_SEVERITIES:
+            raise LintConfigError(
+                f"ESLint rule {rule} must be a severity (off, warn, error) or a list starting with one"
+            )
+
+    for field in ("category_weights", "base_deductions"):
+        table = profile.get(field, {})
+        if not isinstance(table, dict):
+            raise LintConfigError(f"{name}.{field} must be a JSON object")
+        for category, value in table.items():
+            if category not in CodeAnalyzer.DEFAULT_CATEGORY_WEIGHTS:
+                raise LintConfigError(f"Unknown category in {name}.{field}: {category}")
+            if not isinstance(value, (int, float)) or isinstance(value, bool) or value < 0:
+                raise LintConfigError(f"{name}.{field}.{category} must be a non-negative number")
+
+
+def _validate_weights(profile: Dict[str, Any], name: str) -> None:
+    """Check that the category weights, after defaults are applied, keep the total score out of 100."""
+    weights = {**CodeAnalyzer.DEFAULT_CATEGORY_WEIGHTS, **profile.get("category_weights", {})}
+    total = sum(weights.values())
+    if abs(total - 100) > 1e-6:
+        raise LintConfigError(f"Category weights in {name} must add up to 100, got {total:g}")
+
+
+class LintConfigCache:
+    """
+    Compiles named profiles and inline overrides once and keeps the results
+    in an LRU cache keyed by a hash of the request's configuration.
+    """
+
+    def __init__(self, profiles_path: str, max_size: Optional[int] = None):
+        self.profiles = self._load_profiles(profiles_path)
+        self.max_size = max_size or int(os.getenv('LINT_CONFIG_CACHE_SIZE', 32))
+        self.compiled_dir = tempfile.mkdtemp(prefix='lint-config-')
+        self._cache = OrderedDict()
+        self._lock = threading.Lock()
+
+    def _load_profiles(self, profiles_path: str) -> Dict[str, Dict[str, Any]]:
+        """Load named profiles from disk."""
+        try:
+            with open(profiles_path, 'r', encoding='utf-8') as f:
+                profiles = json.load(f)
+        except Exception as e:
+            print(f"Error loading lint profiles: {str(e)}")
+            return {}
+
+        for name, profile in profiles.items():
+            _validate_profile(profile, f"profile '{name}'")
+            _validate_weights(profile, f"profile '{name}'")
+        return profiles
+
+    def resolve(self, profile: Optional[str] = None, override: Optional[str] = None) -> CompiledLintConfig:
+        """
+        Return the compiled configuration for a named profile and/or an inline
+        JSON override, compiling it on first use.
+        """
+        if profile and profile not in self.profiles:
+            raise LintConfigError(
+                f"Unknown profile '{profile}'. Available profiles are: {', '.join(sorted(self.profiles))}"
+            )
+
+        try:
+            override_data = json.loads(override) if override else {}
+        except json.JSONDecodeError as e:
+            raise LintConfigError(f"Inline config is not valid JSON: {str(e)}")
+        _validate_profile(override_data, "config")
+
+        canonical = json.dumps({"profile": profile, "override": override_data}, sort_keys=True)
+        key = hashlib.sha256(canonical.encode('utf-8')).hexdigest()
+
+        with self._lock:
+            if key in self._cache:
+                self._cache.move_to_end(key)
+                return self._cache[key]
+
+        merged = _merge_profiles(self.profiles.get(profile, {}) if profile else {}, override_data)
+        _validate_weights(merged, "config")
+        compiled = self._compile(key, merged)
+
+        with self._lock:
+            if key in self._cache:
+                # Another request compiled the same profile meanwhile
+                self._cache.move_to_end(key)
+                return self._cache[key]
+            self._cache[key] = compiled
+            while len(self._cache) > self.max_size:
+                self._cache.popitem(last=False)
+        return compiled
+
+    def _compile(self, key: str, profile: Dict[str, Any]) -> CompiledLintConfig:
+        """Turn a merged profile into Pylint arguments, an ESLint config file and a scorer."""
+        pylint = profile["pylint"]
+        pylint_args = []
+        if pylint["disable"]:
+            pylint_args.append(f"--disable={','.join(pylint['disable'])}")
+        if pylint["enable"]:
+            pylint_args.append(f"--enable={','.join(pylint['enable'])}")
+        for option, value in sorted(pylint["options"].items()):
+            if isinstance(value, list):
+                value = ','.join(value)
+            pylint_args.append(f"--{option}={value}")
+
+        eslint_config_path = None
+        rules = profile["eslint"]["rules"]
+        if rules:
+            plugins = sorted({rule.split('/')[0] for rule in rules if '/' in rule})
+            eslint_config = {"plugins": plugins, "rules": rules} if plugins else {"rules": rules}
+            eslint_config_path = self._write_eslint_config(eslint_config)
+
+        code_analyzer = CodeAnalyzer(
+            category_weights=profile["category_weights"],
+            base_deductions=profile["base_deductions"]
+        )
+        return CompiledLintConfig(key, pylint_args, eslint_config_path, code_analyzer)
+
+    def _write_eslint_config(self, eslint_config: Dict[str, Any]) -> str:
+        """
+        Write an ESLint config to a file named after its content and return the path.
+
+        Files are never deleted while the server runs, so a request still holding an
+        evicted configuration can always read it; identical rule sets share one file.
+        """
+        content = json.dumps(eslint_config, sort_keys=True)
+        digest = hashlib.sha256(content.encode('utf-8')).hexdigest()
+        path = os.path.join(self.compiled_dir, f"{digest}.eslintrc.json")
+        if not os.path.exists(path):
+            # Write atomically so a concurrent ESLint run never reads a partial file
+            temp_path = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+            with open(temp_path, 'w', encoding='utf-8') as f:
+                f.write(content)
+            os.replace(temp_path, path)
+        return path
+
+    def cleanup(self) -> None:
+        """Remove all compiled configuration files."""
+        shutil.rmtree(self.compiled_dir, ignore_errors=True)
@@ -0,0 +1,325 @@
+import os
+import io
+import gc
+import sys
+import json
+import time
+import queue
+import signal
+import threading
+import multiprocessing
+from collections import deque
+from typing import Dict, Any, List, Optional
+
+try:
+    import resource
+except ImportError:  # Not available on Windows; limits are skipped there
+    resource = None
+
+
+def _env_int(name: str, default: int) -> int:
+    """Read an integer setting from the environment, falling back to a default."""
+    try:
+        return int(os.getenv(name, default))
+    except (TypeError, ValueError):
+        return default
+
+
+def _peak_rss_mb() -> float:
+    """Return the peak resident set size of the current process in megabytes."""
+    if resource is None:
+        return 0.0
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # ru_maxrss is reported in bytes on macOS and kilobytes on Linux
+    divisor = 1024 * 1024 if sys.platform == 'darwin' else 1024
+    return round(peak / divisor, 1)
+
+
+def _apply_memory_limit(memory_mb: int) -> None:
+    """Cap the address space of the current process."""
+    if resource is None or memory_mb <= 0:
+        return
+    limit = memory_mb * 1024 * 1024
+    _, hard = resource.getrlimit(resource.RLIMIT_AS)
+    if hard != resource.RLIM_INFINITY:
+        limit = min(limit, hard)
+    resource.setrlimit(resource.RLIMIT_AS, (limit, hard))
+
+
+def _apply_cpu_budget(cpu_seconds: int) -> None:
+    """Allow the current process at most cpu_seconds more CPU time.
+
+    RLIMIT_CPU counts the whole lifetime of the process, so a long-lived
+    worker moves the soft limit forward before every job.
+    """
+    if resource is None or cpu_seconds <= 0:
+        return
+    usage = resource.getrusage(resource.RUSAGE_SELF)
+    soft = int(usage.ru_utime + usage.ru_stime) + cpu_seconds + 1
+    _, hard = resource.getrlimit(resource.RLIMIT_CPU)
+    if hard != resource.RLIM_INFINITY:
+        soft = min(soft, hard)
+    resource.setrlimit(resource.RLIMIT_CPU, (soft, hard))
+
+
+def cpu_limited_command(command: List[str], cpu_seconds: int) -> List[str]:
+    """
+    Wrap a command so that it runs under a per-job CPU limit.
+
+    The limit is set by a shell before exec rather than with preexec_fn,
+    which is unsafe when the caller has threads running.
+    """
+    if os.name == 'nt' or cpu_seconds <= 0:
+        return command
+    return ['/bin/sh', '-c', 'ulimit -t "$1" && shift && exec "$@"', 'sh', str(cpu_seconds), *command]
+
+
+def _clear_caches() -> None:
+    """Drop astroid's module and inference caches accumulated by the last job."""
+    try:
+        from astroid import MANAGER
+        MANAGER.clear_cache()
+    except Exception as e:
+        print(f"Error clearing astroid caches: {str(e)}")
+    gc.collect()
+
+
+def _lint_python(file_path: str, rcfile: str, args: List[str]) -> List[Dict[str, Any]]:
+    """Run Pylint in-process with extra command line arguments and return its JSON messages."""
+    from pylint.lint import Run
+    from pylint.reporters import JSONReporter
+
+    output = io.StringIO()
+    Run(['--rcfile', rcfile, *args, file_path], reporter=JSONReporter(output), exit=False)
+    return json.loads(output.getvalue() or '[]')
+
+
+def _worker_main(conn, limits: Dict[str, int]) -> None:
+    """Entry point of a lint worker process: serve jobs until told to stop."""
+    _apply_memory_limit(limits['job_memory_mb'])
+
+    while True:
+        try:
+            job = conn.recv()
+        except (EOFError, KeyboardInterrupt):
+            break
+        if job is None:
+            break
+
+        _apply_cpu_budget(limits['job_cpu_seconds'])
+        error = None
+        try:
+            messages = _lint_python(job['file_path'], job['rcfile'], job['args'])
+        except MemoryError:
+            messages, error = [], "memory limit exceeded"
+        except SystemExit as e:
+            # Pylint exits on invalid arguments; keep the worker alive and report it
+            messages, error = [], f"Pylint exited with code {e.code}"
+        except Exception as e:
+            messages, error = [], str(e)
+
+        _clear_caches()
+        conn.send({
+            "messages": messages,
+            "error": error,
+            "peak_rss_mb": _peak_rss_mb()
+        })
+
+    conn.close()
+
+
+class LintJobError(Exception):
+    """Raised when a lint job fails or exceeds its resource limits."""
+
+
+class LintWorkersBusyError(LintJobError):
+    """Raised when no lint worker becomes idle within the wait timeout."""
+
+
+class LintWorker:
+    """A single long-lived lint process with its own resource limits."""
+
+    def __init__(self, worker_id: int, limits: Dict[str, int]):
+        self.worker_id = worker_id
+        self.limits = limits
+        self.process = None
+        self.conn = None
+        self.jobs_done = 0
+        self.peak_rss_mb = 0.0
+        self.started_at = None
+
+    def is_alive(self) -> bool:
+        """Check if the worker process is running."""
+        return self.process is not None and self.process.is_alive()
+
+    def start(self) -> None:
+        """Spawn a fresh worker process."""
+        if self.conn is not None:
+            self.conn.close()
+        context = multiprocessing.get_context('spawn')
+        parent_conn, child_conn = context.Pipe()
+        self.process = context.Process(
+            target=_worker_main,
+            args=(child_conn, self.limits),
+            name=f"lint-worker-{self.worker_id}",
+            daemon=True
+        )
+        self.process.start()
+        child_conn.close()
+        self.conn = parent_conn
+        self.jobs_done = 0
+        self.peak_rss_mb = 0.0
+        self.started_at = time.time()
+
+    def stop(self) -> None:
+        """Ask the worker to exit, killing it if it does not comply."""
+        if self.process is None:
+            return
+        try:
+            if self.process.is_alive():
+                self.conn.send(None)
+                self.process.join(timeout=2)
+        except (OSError, EOFError, BrokenPipeError):
+            pass
+        if self.process.is_alive():
+            self.process.kill()
+            self.process.join(timeout=2)
+        self.conn.close()
+        self.process = None
+        self.conn = None
+
+    def run(self, file_path: str, rcfile: str, args: List[str]) -> List[Dict[str, Any]]:
+        """Send one Pylint job to the worker and wait for its messages."""
+        if not self.is_alive():
+            self.start()
+
+        try:
+            self.conn.send({"file_path": file_path, "rcfile": rcfile, "args": args})
+            if not self.conn.poll(self.limits['job_timeout']):
+                raise LintJobError(f"timed out after {self.limits['job_timeout']}s")
+            reply = self.conn.recv()
+        except (EOFError, OSError):
+            # The process was killed, typically by RLIMIT_CPU or the OOM killer
+            self.process.join(timeout=2)
+            raise LintJobError(self._exit_reason())
+
+        self.jobs_done += 1
+        self.peak_rss_mb = reply['peak_rss_mb']
+        if reply['error']:
+            raise LintJobError(reply['error'])
+        return reply['messages']
+
+    def _exit_reason(self) -> str:
+        """Describe how the worker process ended."""
+        exitcode = self.process.exitcode
+        if exitcode is None:
+            return "worker stopped responding"
+        if exitcode < 0:
+            try:
+                return f"worker killed by {signal.Signals(-exitcode).name}"
+            except ValueError:
+                return f"worker killed by signal {-exitcode}"
+        return f"worker exited with code {exitcode}"
+
+
+class LintWorkerPool:
+    """Pool of lint workers that are recycled before their memory grows unbounded."""
+
+    def __init__(self, size: Optional[int] = None):
+        self.size = size or _env_int('LINT_WORKERS', 2)
+        self.max_jobs_per_worker = _env_int('LINT_WORKER_MAX_JOBS', 100)
+        self.recycle_rss_mb = _env_int('LINT_WORKER_RECYCLE_RSS_MB', 512)
+        self.wait_timeout = _env_int('LINT_WORKER_WAIT_TIMEOUT', 30)
+        self.limits = {
+            "job_memory_mb": _env_int('LINT_JOB_MEMORY_MB', 1024),
+            "job_cpu_seconds": _env_int('LINT_JOB_CPU_SECONDS', 30),
+            "job_timeout": _env_int('LINT_JOB_TIMEOUT', 60)
+        }
+
+        self._workers = [LintWorker(i, self.limits) for i in range(self.size)]
+        self._idle = queue.Queue()
+        for worker in self._workers:
+            self._idle.put(worker)
+
+        self._lock = threading.Lock()
+        self._jobs_total = 0
+        self._jobs_failed = 0
+        self._recycle_count = 0
+        self._recycle_events = deque(maxlen=50)
+
+    def run_pylint(self, file_path: str, rcfile: str, args: Optional[List[str]] = None) -> List[Dict[str, Any]]:
+        """
+        Lint a Python file on the next idle worker.
+        Raises LintWorkersBusyError if no worker frees up within wait_timeout seconds.
+        """
+        try:
+            worker = self._idle.get(timeout=self.wait_timeout)
+        except queue.Empty:
+            raise LintWorkersBusyError(f"no lint worker became idle within {self.wait_timeout}s")
+        try:
+            messages = worker.run(file_path, rcfile, args or [])
+            self._record_job(failed=False)
+        except LintJobError as e:
+            self._record_job(failed=True)
+            self._recycle(worker, f"job failed: {str(e)}")
+            raise
+        else:
+            if worker.jobs_done >= self.max_jobs_per_worker:
+                self._recycle(worker, f"reached {self.max_jobs_per_worker} jobs")
+            elif worker.peak_rss_mb >= self.recycle_rss_mb:
+                self._recycle(worker, f"peak RSS {worker.peak_rss_mb}MB over {self.recycle_rss_mb}MB")
+            return messages
+        finally:
+            self._idle.put(worker)
+
+    def _record_job(self, failed: bool) -> None:
+        """Update the job counters."""
+        with self._lock:
+            self._jobs_total += 1
+            if failed:
+                self._jobs_failed += 1
+
+    def _recycle(self, worker: LintWorker, reason: str) -> None:
+        """Stop a worker so that it is respawned on its next job."""
+        event = {
+            "worker_id": worker.worker_id,
+            "reason": reason,
+            "jobs_done": worker.jobs_done,
+            "peak_rss_mb": worker.peak_rss_mb,
+            "timestamp": time.time()
+        }
+        worker.stop()
+        with self._lock:
+            self._recycle_count += 1
+            self._recycle_events.append(event)
+        print(f"Recycled lint worker {worker.worker_id}: {reason}")
+
+    def stats(self) -> Dict[str, Any]:
+        """Report worker memory, job counters and recent recycle events."""
+        with self._lock:
+            return {
+                "size": self.size,
+                "max_jobs_per_worker": self.max_jobs_per_worker,
+                "recycle_rss_mb": self.recycle_rss_mb,
+                "wait_timeout": self.wait_timeout,
+                "limits": dict(self.limits),
+                "jobs_total": self._jobs_total,
+                "jobs_failed": self._jobs_failed,
+                "recycle_count": self._recycle_count,
+                "recent_recycles": list(self._recycle_events),
+                "workers": [
+                    {
+                        "worker_id": worker.worker_id,
+                        "alive": worker.is_alive(),
+                        "jobs_done": worker.jobs_done,
+                        "peak_rss_mb": worker.peak_rss_mb,
+                        "started_at": worker.started_at
+                    }
+                    for worker in self._workers
+                ]
+            }
+
+    def shutdown(self) -> None:
+        """Stop all worker processes."""
+        for worker in self._workers:
+            worker.stop()
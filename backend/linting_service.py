@@ -1,57 +1,91 @@
 import os
 import json
 import subprocess
-from typing import Dict, Any, List
-from code_analyzer import CodeAnalyzer
+from typing import Dict, Any, List, Optional
 from groq_service import GroqService
+from lint_workers import LintWorkerPool, LintJobError, cpu_limited_command
+from lint_config import LintConfigCache, CompiledLintConfig
 
 class LintingService:
     def __init__(self):
         self.config_dir = os.path.join(os.path.dirname(os.path.dirname(__file__)), 'config')
         self.pylintrc_path = os.path.join(self.config_dir, '.pylintrc')
         self.eslintrc_path = os.path.join(self.config_dir, '.eslintrc.json')
-        self.code_analyzer = CodeAnalyzer()
         self.groq_service = GroqService()
+        self.lint_workers = LintWorkerPool()
+        self.lint_configs = LintConfigCache(os.path.join(self.config_dir, 'profiles.json'))
         
-    def _run_pylint(self, file_path: str) -> List[Dict[str, Any]]:
-        """Run Pylint on Python files."""
+    def _run_pylint(self, file_path: str, lint_config: CompiledLintConfig) -> List[Dict[str, Any]]:
+        """
+        Run Pylint on Python files.
+        Raises LintJobError if the job fails or hits a resource limit, so the file is not scored as clean.
+        """
         try:
-            result = subprocess.run(
-                ['pylint', '--rcfile', self.pylintrc_path, '--output-format=json', file_path],
-                capture_output=True,
-                text=True
-            )
-            
-            if result.stdout:
-                return json.loads(result.stdout)
-            return []
-            
-        except Exception as e:
+            return self.lint_workers.run_pylint(file_path, self.pylintrc_path, lint_config.pylint_args)
+        except LintJobError as e:
             print(f"Error running Pylint: {str(e)}")
-            return []
+            raise
 
-    def _run_eslint(self, file_path: str) -> List[Dict[str, Any]]:
-        """Run ESLint on JavaScript/React files."""
+    def _run_eslint(self, file_path: str, lint_config: CompiledLintConfig) -> List[Dict[str, Any]]:
+        """
+        Run ESLint on JavaScript/React files.
+        Raises LintJobError if ESLint times out, cannot start, or fails without producing a report.
+        """
+        npm_path = 'npm.cmd' if os.name == 'nt' else 'npm'
+        config_path = lint_config.eslint_config_path
+        config_args = ['--config', config_path] if config_path else []
+        limits = self.lint_workers.limits
+        # V8 reserves large address ranges up front, so cap its heap instead of RLIMIT_AS
+        env = {
+            **os.environ,
+            'NODE_OPTIONS': f"--max-old-space-size={limits['job_memory_mb']}"
+        }
         try:
-            npm_path = 'npm.cmd' if os.name == 'nt' else 'npm'
+            # --silent keeps npm's script banner out of stdout so it holds only the JSON report
             result = subprocess.run(
-                [npm_path, 'run', 'lint', '--', '--format', 'json', file_path],
+                cpu_limited_command(
+                    [npm_path, 'run', '--silent', 'lint', '--', '--format', 'json', *config_args, file_path],
+                    limits['job_cpu_seconds']
+                ),
                 capture_output=True,
                 text=True,
-                cwd=self.config_dir
+                cwd=self.config_dir,
+                env=env,
+                timeout=limits['job_timeout']
             )
-            
-            if result.stdout:
-                return json.loads(result.stdout)
-            return []
-            
-        except Exception as e:
+        except subprocess.TimeoutExpired:
+            print(f"Error running ESLint: timed out after {limits['job_timeout']}s")
+            raise LintJobError(f"ESLint timed out after {limits['job_timeout']}s")
+        except OSError as e:
             print(f"Error running ESLint: {str(e)}")
-            return []
+            raise LintJobError(f"Could not start ESLint: {str(e)}")
+        
+        # ESLint exits 1 when it reports problems and 2 on configuration or internal errors
+        try:
+            report = json.loads(result.stdout) if result.stdout.strip() else None
+        except json.JSONDecodeError:
+            report = None
+        if report is None:
+            if result.returncode == 0:
+                return []
+            detail = result.stderr.strip()[-500:] or "no output"
+            print(f"Error running ESLint: exit code {result.returncode}: {detail}")
+            raise LintJobError(f"ESLint exited with code {result.returncode}: {detail}")
+        return report
 
-    def analyze_code(self, file_path: str) -> Dict[str, Any]:
-        """Analyze code file based on its extension."""
+    def resolve_config(self, profile: Optional[str] = None, override: Optional[str] = None) -> CompiledLintConfig:
+        """Get the compiled lint configuration for a named profile and/or inline override."""
+        return self.lint_configs.resolve(profile, override)
+    
+    def analyze_code(self, file_path: str, include_violations: bool = False,
+                     lint_config: Optional[CompiledLintConfig] = None) -> Dict[str, Any]:
+        """
+        Analyze code file based on its extension.
+        When include_violations is set, the raw linter violations are returned under "violations".
+        Without a lint_config, the default configuration and scoring are used.
+        """
         _, ext = os.path.splitext(file_path)
+        lint_config = lint_config or self.lint_configs.resolve()
         
         # Read the file content
         try:
@@ -64,7 +98,7 @@ class LintingService:
         violations = []
         
         if ext == '.py':
-            lint_result = self._run_pylint(file_path)
+            lint_result = self._run_pylint(file_path, lint_config)
             violations = [
                 {
                     "message": issue['message'],
@@ -76,7 +110,7 @@ class LintingService:
             ]
                     
         elif ext in ['.js', '.jsx']:
-            lint_result = self._run_eslint(file_path)
+            lint_result = self._run_eslint(file_path, lint_config)
             for result in lint_result:
                 violations.extend([
                     {
@@ -89,7 +123,9 @@ class LintingService:
                 ])
         
         # Get initial analysis from code analyzer
-        analysis_result = self.code_analyzer.analyze_violations(violations, ext)
+        analysis_result = lint_config.code_analyzer.analyze_violations(violations, ext)
+        if include_violations:
+            analysis_result["violations"] = violations
         
         # Enhance analysis with Groq if available
         if code_content and self.groq_service.is_configured():
@@ -102,6 +138,15 @@ class LintingService:
         
         return analysis_result
     
+    def worker_stats(self) -> Dict[str, Any]:
+        """Report memory usage and recycle events of the lint workers."""
+        return self.lint_workers.stats()
+    
+    def shutdown(self):
+        """Stop the lint worker processes and remove compiled lint configurations."""
+        self.lint_workers.shutdown()
+        self.lint_configs.cleanup()
+    
     def _categorize_pylint_message(self, message_id: str) -> str:
         """Categorize Pylint messages into our scoring categories."""
         categories = {
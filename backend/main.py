@@ -1,9 +1,16 @@
 import os
-from typing import List
-from fastapi import FastAPI, UploadFile, HTTPException
+from typing import List, Dict, Any, Iterator, Tuple, Optional
+from fastapi import FastAPI, UploadFile, HTTPException, Form, Request
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import StreamingResponse
+from fastapi.concurrency import run_in_threadpool
+from starlette.background import BackgroundTask
 from dotenv import load_dotenv
 from linting_service import LintingService
+from lint_workers import LintJobError, LintWorkersBusyError
+from lint_config import LintConfigError, CompiledLintConfig
+from result_streams import ndjson_stream, sarif_stream
+from project_uploads import ProjectUpload, UploadError
 
 # Load environment variables
 load_dotenv()
@@ -29,6 +36,29 @@ app.add_middleware(
 
 # Constants
 ALLOWED_EXTENSIONS = {".py", ".js", ".jsx"}
+STREAM_FORMATS = {
+    "ndjson": (ndjson_stream, "application/x-ndjson"),
+    "sarif": (sarif_stream, "application/sarif+json"),
+}
+PROJECT_MAX_FILES = int(os.getenv('PROJECT_MAX_FILES', 5000))
+PROJECT_UPLOAD_SCHEMA = {
+    "requestBody": {
+        "required": True,
+        "content": {
+            "multipart/form-data": {
+                "schema": {
+                    "type": "object",
+                    "required": ["files"],
+                    "properties": {
+                        "files": {"type": "array", "items": {"type": "string", "format": "binary"}},
+                        "profile": {"type": "string"},
+                        "config": {"type": "string"}
+                    }
+                }
+            }
+        }
+    }
+}
 TEMP_UPLOAD_DIR = "../temp_files"
 
 # Ensure temp directory exists
@@ -38,10 +68,18 @@ def validate_file_extension(filename: str) -> bool:
     """Validate if the file extension is allowed."""
     return os.path.splitext(filename)[1].lower() in ALLOWED_EXTENSIONS
 
+def resolve_lint_config(profile: Optional[str], config: Optional[str]) -> CompiledLintConfig:
+    """Resolve the requested lint profile and inline override, rejecting invalid ones."""
+    try:
+        return linting_service.resolve_config(profile, config)
+    except LintConfigError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
 @app.post("/analyze-code")
-async def analyze_code(file: UploadFile):
+async def analyze_code(file: UploadFile, profile: Optional[str] = Form(None), config: Optional[str] = Form(None)):
     """
     Endpoint to handle code file uploads and initiate analysis.
+    An optional named profile and/or inline JSON config override the lint rules and scoring.
     Returns enhanced analysis results including AI-powered insights if available.
     """
     # Validate file extension
@@ -51,6 +89,8 @@ async def analyze_code(file: UploadFile):
             detail=f"File type not allowed. Allowed types are: {', '.join(ALLOWED_EXTENSIONS)}"
         )
     
+    lint_config = resolve_lint_config(profile, config)
+    
     # Create a unique filename to avoid conflicts
     file_extension = os.path.splitext(file.filename)[1]
     temp_file_path = os.path.join(TEMP_UPLOAD_DIR, f"temp_{file.filename}")
@@ -61,11 +101,10 @@ async def analyze_code(file: UploadFile):
             content = await file.read()
             buffer.write(content)
         
-        # Analyze the code
-        analysis_result = linting_service.analyze_code(temp_file_path)
-        
-        # Clean up the temporary file
-        os.remove(temp_file_path)
+        # Analyze the code off the event loop; it blocks while waiting for a lint worker
+        analysis_result = await run_in_threadpool(
+            linting_service.analyze_code, temp_file_path, lint_config=lint_config
+        )
             
         return {
             "message": "Code analysis completed successfully",
@@ -74,12 +113,91 @@ async def analyze_code(file: UploadFile):
             "has_ai_insights": "grok_analysis" in analysis_result
         }
         
+    except LintWorkersBusyError as e:
+        raise HTTPException(status_code=503, detail=f"Lint workers busy: {str(e)}")
+    except LintJobError as e:
+        # The linter failed or hit a resource limit, so there is no score to report
+        raise HTTPException(status_code=422, detail=f"Lint job failed: {str(e)}")
     except Exception as e:
+        raise HTTPException(status_code=500, detail=f"Error processing file: {str(e)}")
+    finally:
         # Clean up the temporary file if it exists
         if os.path.exists(temp_file_path):
             os.remove(temp_file_path)
-        raise HTTPException(status_code=500, detail=f"Error processing file: {str(e)}")
     
+def analyze_uploads(files: List[Tuple[str, str]], lint_config: CompiledLintConfig) -> Iterator[Tuple[str, Dict[str, Any]]]:
+    """
+    Analyze uploaded files one at a time, yielding each result as soon as it completes.
+    Each file is removed once analyzed, and any left over if the client disconnects.
+    """
+    try:
+        for filename, path in files:
+            try:
+                analysis_result = linting_service.analyze_code(path, include_violations=True, lint_config=lint_config)
+            except Exception as e:
+                analysis_result = {"error": f"Error processing file: {str(e)}"}
+            finally:
+                if os.path.exists(path):
+                    os.remove(path)
+            
+            yield filename, analysis_result
+    finally:
+        for _, path in files:
+            if os.path.exists(path):
+                os.remove(path)
+
+@app.post("/analyze-project", openapi_extra=PROJECT_UPLOAD_SCHEMA)
+async def analyze_project(request: Request, format: str = "ndjson"):
+    """
+    Endpoint to analyze multiple code files as a stream.
+    Emits one NDJSON record per file followed by a summary record, or a SARIF 2.1.0 log.
+    Accepts up to PROJECT_MAX_FILES files, each written straight to disk while the upload is read.
+    """
+    if format not in STREAM_FORMATS:
+        raise HTTPException(
+            status_code=400,
+            detail=f"Output format not supported. Supported formats are: {', '.join(STREAM_FORMATS)}"
+        )
+    
+    upload = ProjectUpload(TEMP_UPLOAD_DIR, max_files=PROJECT_MAX_FILES)
+    try:
+        await upload.receive(request.headers, request.stream())
+    except UploadError as e:
+        raise HTTPException(status_code=e.status_code, detail=str(e))
+    
+    try:
+        if not upload.files:
+            raise HTTPException(status_code=400, detail="No files uploaded")
+        
+        invalid_files = [filename for filename, _ in upload.files if not validate_file_extension(filename)]
+        if invalid_files:
+            raise HTTPException(
+                status_code=400,
+                detail=f"File type not allowed for {', '.join(invalid_files)}. Allowed types are: {', '.join(ALLOWED_EXTENSIONS)}"
+            )
+        
+        lint_config = resolve_lint_config(upload.fields.get("profile"), upload.fields.get("config"))
+    except HTTPException:
+        upload.cleanup()
+        raise
+    
+    writer, media_type = STREAM_FORMATS[format]
+    return StreamingResponse(
+        writer(analyze_uploads(upload.files, lint_config)),
+        media_type=media_type,
+        background=BackgroundTask(upload.cleanup)
+    )
+
+@app.get("/lint-workers")
+async def lint_workers():
+    """Report lint worker memory usage, job counters and recycle events."""
+    return linting_service.worker_stats()
+
+@app.on_event("shutdown")
+def shutdown_lint_workers():
+    """Stop lint worker processes when the server exits."""
+    linting_service.shutdown()
+
 @app.get("/")
 async def root():
     """Root endpoint for API health check."""
@@ -0,0 +1,128 @@
+import os
+import uuid
+from typing import Dict, List, Tuple, AsyncIterator, Optional
+from multipart.multipart import MultipartParser, parse_options_header
+
+MAX_FIELD_BYTES = 64 * 1024
+
+
+class UploadError(Exception):
+    """Raised when a project upload is malformed, over its limits, or cannot be stored."""
+
+    def __init__(self, message: str, status_code: int = 400):
+        super().__init__(message)
+        self.status_code = status_code
+
+
+class ProjectUpload:
+    """
+    A multipart project upload whose files are each written straight to their
+    own file on disk. A file is closed as soon as its part ends, so memory and
+    open file descriptors stay constant however many files are uploaded.
+    """
+
+    def __init__(self, upload_dir: str, max_files: int, max_fields: int = 10):
+        self.upload_dir = upload_dir
+        self.max_files = max_files
+        self.max_fields = max_fields
+        self.files: List[Tuple[str, str]] = []
+        self.fields: Dict[str, str] = {}
+        self._reset_part()
+
+    def _reset_part(self) -> None:
+        """Forget the state of the part being parsed."""
+        self._headers = {}
+        self._header_field = b""
+        self._header_value = b""
+        self._name = ""
+        self._filename: Optional[str] = None
+        self._path: Optional[str] = None
+        self._out = None
+        self._value = b""
+
+    async def receive(self, headers, stream: AsyncIterator[bytes]) -> None:
+        """Parse the request body, writing each uploaded file to disk as it arrives."""
+        content_type, options = parse_options_header(headers.get("content-type", ""))
+        if content_type != b"multipart/form-data" or b"boundary" not in options:
+            raise UploadError("Expected a multipart/form-data upload")
+
+        parser = MultipartParser(options[b"boundary"], callbacks={
+            "on_part_begin": self._reset_part,
+            "on_header_field": self._on_header_field,
+            "on_header_value": self._on_header_value,
+            "on_header_end": self._on_header_end,
+            "on_headers_finished": self._on_headers_finished,
+            "on_part_data": self._on_part_data,
+            "on_part_end": self._on_part_end,
+        })
+
+        try:
+            async for chunk in stream:
+                if chunk:
+                    parser.write(chunk)
+            parser.finalize()
+            if self._out is not None:
+                raise UploadError("Incomplete multipart body")
+        except UploadError:
+            self.cleanup()
+            raise
+        except OSError as e:
+            self.cleanup()
+            raise UploadError(f"Upload could not be stored: {str(e)}", status_code=413)
+        except Exception as e:
+            self.cleanup()
+            raise UploadError(f"Malformed multipart body: {str(e)}")
+
+    def _on_header_field(self, data: bytes, start: int, end: int) -> None:
+        self._header_field += data[start:end]
+
+    def _on_header_value(self, data: bytes, start: int, end: int) -> None:
+        self._header_value += data[start:end]
+
+    def _on_header_end(self) -> None:
+        self._headers[self._header_field.lower()] = self._header_value
+        self._header_field = b""
+        self._header_value = b""
+
+    def _on_headers_finished(self) -> None:
+        """Open a file on disk for a file part; form fields are buffered."""
+        _, options = parse_options_header(self._headers.get(b"content-disposition", b""))
+        self._name = options.get(b"name", b"").decode("utf-8", errors="replace")
+        if b"filename" not in options:
+            if len(self.fields) >= self.max_fields:
+                raise UploadError(f"Too many fields. Maximum number of fields is {self.max_fields}.")
+            return
+
+        if len(self.files) >= self.max_files:
+            raise UploadError(f"Too many files. Maximum number of files is {self.max_files}.")
+        self._filename = options[b"filename"].decode("utf-8", errors="replace")
+        extension = os.path.splitext(self._filename)[1]
+        self._path = os.path.join(self.upload_dir, f"upload_{uuid.uuid4().hex}{extension}")
+        self._out = open(self._path, "wb")
+
+    def _on_part_data(self, data: bytes, start: int, end: int) -> None:
+        if self._out is not None:
+            self._out.write(data[start:end])
+            return
+        self._value += data[start:end]
+        if len(self._value) > MAX_FIELD_BYTES:
+            raise UploadError(f"Field '{self._name}' is larger than {MAX_FIELD_BYTES} bytes")
+
+    def _on_part_end(self) -> None:
+        """Close a finished file so no descriptor stays open while later parts arrive."""
+        if self._out is not None:
+            self._out.close()
+            self._out = None
+            self.files.append((self._filename, self._path))
+        else:
+            self.fields[self._name] = self._value.decode("utf-8", errors="replace")
+
+    def cleanup(self) -> None:
+        """Remove every file of this upload that is still on disk."""
+        if self._out is not None:
+            self._out.close()
+            self._out = None
+            self.files.append((self._filename, self._path))
+        for _, path in self.files:
+            if os.path.exists(path):
+                os.remove(path)
@@ -0,0 +1,134 @@
+import json
+from urllib.parse import quote
+from typing import Dict, Any, Iterable, Iterator, Tuple
+
+SARIF_SCHEMA = "https://json.schemastore.org/sarif-2.1.0.json"
+
+# Pylint message types and ESLint numeric severities mapped to SARIF levels
+SARIF_LEVELS = {
+    "fatal": "error",
+    "error": "error",
+    "warning": "warning",
+    "refactor": "note",
+    "convention": "note",
+    "info": "note",
+    2: "error",
+    1: "warning",
+    0: "note",
+}
+
+
+class ProjectSummary:
+    """Running aggregate over per-file results, kept constant in size."""
+
+    def __init__(self):
+        self.files_analyzed = 0
+        self.files_failed = 0
+        self.total_violations = 0
+        self.score_sum = 0
+        self.category_sums = {}
+
+    def add(self, analysis: Dict[str, Any]) -> None:
+        """Fold one file's analysis into the aggregate."""
+        if "error" in analysis:
+            self.files_failed += 1
+            return
+
+        self.files_analyzed += 1
+        self.total_violations += len(analysis.get("violations", []))
+        self.score_sum += analysis.get("total_score", 0)
+        for category, score in analysis.get("category_scores", {}).items():
+            self.category_sums[category] = self.category_sums.get(category, 0) + score
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Return the aggregate with averaged scores."""
+        count = self.files_analyzed or 1
+        return {
+            "files_analyzed": self.files_analyzed,
+            "files_failed": self.files_failed,
+            "total_violations": self.total_violations,
+            "average_score": round(self.score_sum / count, 2),
+            "average_category_scores": {
+                category: round(total / count, 2)
+                for category, total in self.category_sums.items()
+            }
+        }
+
+
+def ndjson_stream(results: Iterable[Tuple[str, Dict[str, Any]]]) -> Iterator[str]:
+    """
+    Yield one NDJSON record per analyzed file, followed by a summary record.
+    """
+    summary = ProjectSummary()
+
+    for filename, analysis in results:
+        summary.add(analysis)
+        if "error" in analysis:
+            record = {"type": "error", "filename": filename, "detail": analysis["error"]}
+        else:
+            record = {"type": "file", "filename": filename, "analysis": analysis}
+        yield json.dumps(record) + "\n"
+
+    yield json.dumps({"type": "summary", **summary.to_dict()}) + "\n"
+
+
+def _sarif_result(filename: str, violation: Dict[str, Any]) -> Dict[str, Any]:
+    """Convert a single violation into a SARIF result object."""
+    return {
+        "ruleId": violation.get("rule") or "unknown",
+        "level": SARIF_LEVELS.get(violation.get("severity"), "warning"),
+        "message": {"text": violation.get("message", "")},
+        "locations": [{
+            "physicalLocation": {
+                "artifactLocation": {"uri": quote(filename)},
+                "region": {"startLine": max(1, violation.get("line") or 1)}
+            }
+        }]
+    }
+
+
+def sarif_stream(results: Iterable[Tuple[str, Dict[str, Any]]]) -> Iterator[str]:
+    """
+    Yield a SARIF 2.1.0 log in chunks, writing results as each file completes.
+
+    The rules list, invocation and run summary are written after the results,
+    so only the rule ids seen so far and the failed files are kept in memory.
+    Files that failed analysis are reported as tool execution notifications.
+    """
+    summary = ProjectSummary()
+    rule_ids = set()
+    notifications = []
+    first = True
+
+    yield f'{{"version": "2.1.0", "$schema": "{SARIF_SCHEMA}", "runs": [{{"results": ['
+
+    for filename, analysis in results:
+        summary.add(analysis)
+        if "error" in analysis:
+            notifications.append({
+                "level": "error",
+                "message": {"text": analysis["error"]},
+                "locations": [{"physicalLocation": {"artifactLocation": {"uri": quote(filename)}}}]
+            })
+            continue
+        for violation in analysis.get("violations", []):
+            result = _sarif_result(filename, violation)
+            rule_ids.add(result["ruleId"])
+            yield ("" if first else ", ") + json.dumps(result)
+            first = False
+
+    tool = {
+        "driver": {
+            "name": "Code Analysis API",
+            "version": "1.0.0",
+            "rules": [{"id": rule_id} for rule_id in sorted(rule_ids)]
+        }
+    }
+    invocation = {
+        "executionSuccessful": not notifications,
+        "toolExecutionNotifications": notifications
+    }
+    yield (
+        f'], "tool": {json.dumps(tool)}, "invocations": [{json.dumps(invocation)}], '
+        f'"properties": {json.dumps(summary.to_dict())}}}]}}'
+    )
@@ -0,0 +1,143 @@
+import json
+import os
+
+import pytest
+
+from lint_config import LintConfigCache, LintConfigError
+
+PROFILES = {
+    "strict": {
+        "pylint": {"disable": ["C0114"], "options": {"max-args": 4}},
+        "eslint": {"rules": {"max-len": ["error", {"code": 80}]}},
+        "base_deductions": {"formatting": 5}
+    }
+}
+
+
+@pytest.fixture
+def cache(tmp_path):
+    profiles_path = tmp_path / "profiles.json"
+    profiles_path.write_text(json.dumps(PROFILES))
+    cache = LintConfigCache(str(profiles_path), max_size=2)
+    yield cache
+    cache.cleanup()
+
+
+def test_same_config_is_compiled_once(cache):
+    first = cache.resolve("strict", '{"base_deductions": {"formatting": 1}}')
+    second = cache.resolve("strict", '{ "base_deductions" : { "formatting" : 1 } }')
+
+    assert first is second
+    assert cache.resolve("strict") is not first
+
+
+def test_override_is_merged_over_profile(cache):
+    compiled = cache.resolve("strict", json.dumps({
+        "pylint": {"disable": ["C0116"], "options": {"max-args": 6, "good-names": ["i", "j"]}},
+        "eslint": {"rules": {"react/prop-types": "off"}},
+        "category_weights": {"formatting": 25, "best_practices": 10}
+    }))
+
+    assert compiled.pylint_args == ["--disable=C0114,C0116", "--good-names=i,j", "--max-args=6"]
+    with open(compiled.eslint_config_path, encoding='utf-8') as f:
+        assert json.load(f) == {
+            "plugins": ["react"],
+            "rules": {"max-len": ["error", {"code": 80}], "react/prop-types": "off"}
+        }
+    assert compiled.code_analyzer.category_weights["formatting"] == 25
+    assert sum(compiled.code_analyzer.category_weights.values()) == 100
+    assert compiled.code_analyzer.base_deductions["formatting"] == 5
+
+
+def test_default_config_has_no_overrides(cache):
+    compiled = cache.resolve()
+
+    assert compiled.pylint_args == []
+    assert compiled.eslint_config_path is None
+
+
+def test_lru_eviction_removes_least_recently_used(cache):
+    strict = cache.resolve("strict")
+    light = cache.resolve(None, '{"base_deductions": {"formatting": 1}}')
+    assert cache.resolve("strict") is strict
+
+    cache.resolve(None, '{"base_deductions": {"formatting": 2}}')
+
+    assert len(cache._cache) == 2
+    assert strict.key in cache._cache
+    assert light.key not in cache._cache
+
+
+def test_eslint_config_file_outlives_eviction(cache):
+    strict = cache.resolve("strict")
+    cache.resolve(None, '{"base_deductions": {"formatting": 1}}')
+    cache.resolve(None, '{"base_deductions": {"formatting": 2}}')
+
+    assert strict.key not in cache._cache
+    assert os.path.exists(strict.eslint_config_path)
+
+
+def test_identical_eslint_rules_share_one_file(cache):
+    strict = cache.resolve("strict")
+    variant = cache.resolve("strict", '{"base_deductions": {"formatting": 1}}')
+
+    assert variant is not strict
+    assert variant.eslint_config_path == strict.eslint_config_path
+    assert len(os.listdir(cache.compiled_dir)) == 1
+
+
+@pytest.mark.parametrize("override, message", [
+    ('{bad', "not valid JSON"),
+    ('{"rules": {}}', "Unknown keys"),
+    ('{"pylint": {"options": {"max-args": "abc"}}}', "must be a non-negative integer"),
+    ('{"pylint": {"options": {"max-args": true}}}', "must be a non-negative integer"),
+    ('{"pylint": {"options": {"good-names": ["j k"]}}}', "must be a list of names"),
+    ('{"pylint": {"options": {"init-hook": "import os"}}}', "not allowed"),
+    ('{"pylint": {"disable": ["C0114,--load-plugins=x"]}}', "message ids"),
+    ('{"eslint": {"rules": {"max-len": "bogus"}}}', "must be a severity"),
+    ('{"eslint": {"rules": {"max-len": []}}}', "must be a severity"),
+    ('{"eslint": {"rules": {"unknown/rule": "off"}}}', "plugin not available"),
+    ('{"category_weights": {"speed": 10}}', "Unknown category"),
+    ('{"base_deductions": {"formatting": -1}}', "non-negative number"),
+])
+def test_invalid_override_is_rejected(cache, override, message):
+    with pytest.raises(LintConfigError, match=message):
+        cache.resolve(None, override)
+
+
+@pytest.mark.parametrize("override", [
+    '{"category_weights": {"formatting": 300}}',
+    '{"category_weights": {"formatting": 10}}',
+])
+def test_weights_not_adding_up_to_100_are_rejected(cache, override):
+    with pytest.raises(LintConfigError, match="must add up to 100"):
+        cache.resolve(None, override)
+
+
+def test_profile_weights_are_checked_with_override(cache):
+    with pytest.raises(LintConfigError, match="must add up to 100"):
+        cache.resolve("strict", '{"category_weights": {"documentation": 0}}')
+    assert cache.resolve(None, '{"category_weights": {"documentation": 0, "best_practices": 40}}')
+
+
+def test_profile_with_bad_weights_fails_to_load(tmp_path):
+    profiles_path = tmp_path / "profiles.json"
+    profiles_path.write_text(json.dumps({"heavy": {"category_weights": {"formatting": 50}}}))
+
+    with pytest.raises(LintConfigError, match="profile 'heavy' must add up to 100"):
+        LintConfigCache(str(profiles_path))
+
+
+def test_unknown_profile_is_rejected(cache):
+    with pytest.raises(LintConfigError, match="Unknown profile 'nope'"):
+        cache.resolve("nope")
+
+
+def test_bundled_profiles_are_valid():
+    profiles_path = os.path.join(os.path.dirname(__file__), '..', '..', 'config', 'profiles.json')
+    cache = LintConfigCache(profiles_path)
+    try:
+        for name in cache.profiles:
+            assert cache.resolve(name).key
+    finally:
+        cache.cleanup()
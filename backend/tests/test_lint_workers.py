@@ -0,0 +1,92 @@
+import os
+import signal
+import subprocess
+import threading
+
+import pytest
+
+from lint_workers import LintWorkerPool, LintJobError, LintWorkersBusyError, cpu_limited_command
+
+PYLINTRC = os.path.join(os.path.dirname(__file__), '..', '..', 'config', '.pylintrc')
+
+
+@pytest.fixture
+def python_file(tmp_path):
+    path = tmp_path / "sample.py"
+    path.write_text("import os\n\ndef f(a):\n    x = 1\n    return a\n")
+    return str(path)
+
+
+@pytest.fixture
+def pool(monkeypatch):
+    monkeypatch.setenv('LINT_WORKER_MAX_JOBS', '2')
+    pool = LintWorkerPool(size=1)
+    yield pool
+    pool.shutdown()
+
+
+def test_worker_recycled_after_max_jobs(pool, python_file):
+    for _ in range(3):
+        messages = pool.run_pylint(python_file, PYLINTRC)
+        assert any(m['message-id'] == 'W0611' for m in messages)
+
+    stats = pool.stats()
+    assert stats['jobs_total'] == 3
+    assert stats['recycle_count'] == 1
+    assert stats['recent_recycles'][0]['reason'] == "reached 2 jobs"
+    assert stats['workers'][0]['jobs_done'] == 1
+
+
+@pytest.mark.skipif(os.name == 'nt', reason="POSIX signals only")
+def test_killed_worker_reports_signal_and_is_recycled(pool, python_file):
+    worker = pool._workers[0]
+    worker.start()
+    threading.Timer(0.2, lambda: os.kill(worker.process.pid, signal.SIGXCPU)).start()
+
+    with pytest.raises(LintJobError, match="killed by SIGXCPU"):
+        pool.run_pylint(python_file, PYLINTRC)
+
+    stats = pool.stats()
+    assert stats['jobs_failed'] == 1
+    assert stats['recent_recycles'][-1]['reason'] == "job failed: worker killed by SIGXCPU"
+    assert not worker.is_alive()
+
+
+def test_restart_closes_previous_connection(pool, python_file):
+    worker = pool._workers[0]
+    worker.start()
+    old_conn = worker.conn
+    worker.process.kill()
+    worker.process.join()
+
+    assert pool.run_pylint(python_file, PYLINTRC)
+    assert old_conn.closed
+
+
+@pytest.mark.skipif(os.name == 'nt', reason="ulimit is POSIX only")
+def test_cpu_limited_command_sets_ulimit():
+    result = subprocess.run(
+        cpu_limited_command(['/bin/sh', '-c', 'ulimit -t'], 7),
+        capture_output=True,
+        text=True
+    )
+    assert result.stdout.strip() == "7"
+
+
+def test_invalid_pylint_argument_is_a_job_error(pool, python_file):
+    with pytest.raises(LintJobError, match="Pylint exited with code 2"):
+        pool.run_pylint(python_file, PYLINTRC, ['--max-args=abc'])
+
+    assert pool.stats()['jobs_failed'] == 1
+    assert pool.run_pylint(python_file, PYLINTRC)
+
+
+def test_waiting_for_busy_pool_times_out(pool, python_file):
+    pool.wait_timeout = 0.1
+    worker = pool._idle.get()
+    try:
+        with pytest.raises(LintWorkersBusyError, match="no lint worker became idle"):
+            pool.run_pylint(python_file, PYLINTRC)
+    finally:
+        pool._idle.put(worker)
+    assert pool.stats()['jobs_total'] == 0
@@ -0,0 +1,89 @@
+import json
+import asyncio
+import subprocess
+
+import pytest
+
+import linting_service
+from lint_workers import LintJobError, LintWorkersBusyError
+from linting_service import LintingService
+
+
+@pytest.fixture
+def service(monkeypatch):
+    monkeypatch.delenv('GROQ_API_KEY', raising=False)
+    service = LintingService()
+    yield service
+    service.shutdown()
+
+
+def test_failed_pylint_job_is_not_scored_clean(service, tmp_path, monkeypatch):
+    path = tmp_path / "sample.py"
+    path.write_text("x = 1\n")
+
+    def fail(*args, **kwargs):
+        raise LintJobError("worker killed by SIGXCPU")
+
+    monkeypatch.setattr(service.lint_workers, 'run_pylint', fail)
+    with pytest.raises(LintJobError):
+        service.analyze_code(str(path))
+
+
+def _completed(returncode, stdout="", stderr=""):
+    return subprocess.CompletedProcess(args=[], returncode=returncode, stdout=stdout, stderr=stderr)
+
+
+@pytest.fixture
+def js_file(tmp_path):
+    path = tmp_path / "sample.js"
+    path.write_text("var x = 1;\n")
+    return str(path)
+
+
+def test_eslint_failure_without_report_is_not_scored_clean(service, js_file, monkeypatch):
+    monkeypatch.setattr(
+        linting_service.subprocess, 'run',
+        lambda *args, **kwargs: _completed(2, stderr="Oops! Something went wrong!")
+    )
+
+    with pytest.raises(LintJobError, match="exited with code 2: Oops"):
+        service.analyze_code(js_file)
+
+
+def test_eslint_report_with_problems_is_parsed(service, js_file, monkeypatch):
+    report = [{"messages": [{"message": "'x' is unused", "line": 1, "severity": 2, "ruleId": "no-unused-vars"}]}]
+    calls = []
+
+    def run(command, **kwargs):
+        calls.append(command)
+        return _completed(1, stdout=json.dumps(report))
+
+    monkeypatch.setattr(linting_service.subprocess, 'run', run)
+    lint_config = service.resolve_config(None, '{"eslint": {"rules": {"max-len": "off"}}}')
+    result = service.analyze_code(js_file, include_violations=True, lint_config=lint_config)
+
+    assert result["violations"][0]["rule"] == "no-unused-vars"
+    assert '--silent' in calls[0]
+    assert calls[0][calls[0].index('--config') + 1] == lint_config.eslint_config_path
+
+
+def test_analyze_code_endpoint_runs_off_event_loop_and_reports_busy_pool(monkeypatch):
+    from fastapi.testclient import TestClient
+    import main
+
+    calls = []
+
+    def busy(*args, **kwargs):
+        try:
+            asyncio.get_running_loop()
+            calls.append("event loop")
+        except RuntimeError:
+            calls.append("worker thread")
+        raise LintWorkersBusyError("no lint worker became idle within 0s")
+
+    monkeypatch.setattr(main.linting_service, 'analyze_code', busy)
+    with TestClient(main.app) as client:
+        response = client.post('/analyze-code', files={'file': ('a.py', b'x = 1\n')})
+
+    assert calls == ["worker thread"]
+    assert response.status_code == 503
@@ -0,0 +1,87 @@
+import asyncio
+import os
+
+import pytest
+
+from project_uploads import ProjectUpload, UploadError
+
+BOUNDARY = "testboundary"
+HEADERS = {"content-type": f"multipart/form-data; boundary={BOUNDARY}"}
+
+
+def _body(files, fields=None):
+    parts = []
+    for name, value in (fields or {}).items():
+        parts.append(
+            f'--{BOUNDARY}\r\nContent-Disposition: form-data; name="{name}"\r\n\r\n{value}\r\n'.encode()
+        )
+    for filename, content in files:
+        parts.append(
+            f'--{BOUNDARY}\r\nContent-Disposition: form-data; name="files"; filename="{filename}"\r\n'
+            f'Content-Type: text/plain\r\n\r\n'.encode() + content + b"\r\n"
+        )
+    return b"".join(parts) + f"--{BOUNDARY}--\r\n".encode()
+
+
+async def _chunks(body, size=7):
+    for i in range(0, len(body), size):
+        yield body[i:i + size]
+
+
+def _receive(upload, body, headers=HEADERS):
+    asyncio.run(upload.receive(headers, _chunks(body)))
+
+
+def test_files_are_written_to_disk_and_closed(tmp_path):
+    upload = ProjectUpload(str(tmp_path), max_files=10)
+    _receive(upload, _body([("a b.py", b"x = 1\n"), ("c.js", b"var y;\n" * 1000)], {"profile": "strict"}))
+
+    assert [filename for filename, _ in upload.files] == ["a b.py", "c.js"]
+    assert upload.fields == {"profile": "strict"}
+    with open(upload.files[1][1], "rb") as f:
+        assert f.read() == b"var y;\n" * 1000
+    assert upload._out is None
+
+    upload.cleanup()
+    assert os.listdir(tmp_path) == []
+
+
+def test_more_files_than_open_descriptors_allow(tmp_path):
+    upload = ProjectUpload(str(tmp_path), max_files=2000)
+    _receive(upload, _body([(f"f{i}.py", b"x = 1\n") for i in range(1500)]))
+
+    assert len(upload.files) == 1500
+    upload.cleanup()
+
+
+def test_too_many_files_is_rejected_and_cleaned_up(tmp_path):
+    upload = ProjectUpload(str(tmp_path), max_files=2)
+
+    with pytest.raises(UploadError, match="Too many files") as error:
+        _receive(upload, _body([("a.py", b"1"), ("b.py", b"2"), ("c.py", b"3")]))
+
+    assert error.value.status_code == 400
+    assert os.listdir(tmp_path) == []
+
+
+def test_storage_failure_is_reported(tmp_path):
+    upload = ProjectUpload(str(tmp_path / "missing"), max_files=2)
+
+    with pytest.raises(UploadError, match="could not be stored") as error:
+        _receive(upload, _body([("a.py", b"1")]))
+
+    assert error.value.status_code == 413
+
+
+def test_oversized_field_is_rejected(tmp_path):
+    upload = ProjectUpload(str(tmp_path), max_files=2)
+
+    with pytest.raises(UploadError, match="larger than"):
+        _receive(upload, _body([], {"config": "x" * (70 * 1024)}))
+
+
+def test_non_multipart_body_is_rejected(tmp_path):
+    upload = ProjectUpload(str(tmp_path), max_files=2)
+
+    with pytest.raises(UploadError, match="Expected a multipart/form-data upload"):
+        _receive(upload, b"{}", headers={"content-type": "application/json"})
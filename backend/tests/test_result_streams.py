@@ -0,0 +1,79 @@
+import json
+
+from result_streams import ProjectSummary, ndjson_stream, sarif_stream
+
+
+def _analysis(score, violations):
+    return {
+        "total_score": score,
+        "category_scores": {"formatting": score / 10},
+        "violations": violations
+    }
+
+
+VIOLATION = {"message": "Bad indentation", "line": 3, "severity": "warning", "rule": "W0311"}
+RESULTS = [
+    ("a b#1.py", _analysis(90, [VIOLATION, {**VIOLATION, "severity": 2, "rule": "max-len", "line": 0}])),
+    ("broken.py", {"error": "Error processing file: worker killed by SIGXCPU"}),
+    ("c.js", _analysis(70, [])),
+]
+
+
+def test_project_summary_averages_successful_files():
+    summary = ProjectSummary()
+    for _, analysis in RESULTS:
+        summary.add(analysis)
+
+    assert summary.to_dict() == {
+        "files_analyzed": 2,
+        "files_failed": 1,
+        "total_violations": 2,
+        "average_score": 80.0,
+        "average_category_scores": {"formatting": 8.0}
+    }
+
+
+def test_ndjson_stream_emits_one_record_per_file_and_summary():
+    records = [json.loads(line) for line in ndjson_stream(iter(RESULTS))]
+
+    assert [r["type"] for r in records] == ["file", "error", "file", "summary"]
+    assert records[0]["filename"] == "a b#1.py"
+    assert records[1]["detail"].endswith("SIGXCPU")
+    assert records[3]["files_failed"] == 1
+
+
+def test_ndjson_stream_is_lazy():
+    consumed = []
+
+    def results():
+        for item in RESULTS:
+            consumed.append(item[0])
+            yield item
+
+    stream = ndjson_stream(results())
+    next(stream)
+    assert consumed == ["a b#1.py"]
+
+
+def test_sarif_stream_is_valid_and_reports_failed_files():
+    run = json.loads("".join(sarif_stream(iter(RESULTS))))["runs"][0]
+
+    assert [r["ruleId"] for r in run["results"]] == ["W0311", "max-len"]
+    assert [r["level"] for r in run["results"]] == ["warning", "error"]
+    location = run["results"][1]["locations"][0]["physicalLocation"]
+    assert location["artifactLocation"]["uri"] == "a%20b%231.py"
+    assert location["region"]["startLine"] == 1
+    assert run["tool"]["driver"]["rules"] == [{"id": "W0311"}, {"id": "max-len"}]
+
+    invocation = run["invocations"][0]
+    assert invocation["executionSuccessful"] is False
+    notification = invocation["toolExecutionNotifications"][0]
+    assert notification["level"] == "error"
+    assert notification["locations"][0]["physicalLocation"]["artifactLocation"]["uri"] == "broken.py"
+
+
+def test_sarif_stream_without_failures_is_successful():
+    run = json.loads("".join(sarif_stream(iter([RESULTS[2]]))))["runs"][0]
+
+    assert run["results"] == []
+    assert run["invocations"][0] == {"executionSuccessful": True, "toolExecutionNotifications": []}